@@ -301,6 +301,24 @@ Buffer_push_uint_var(BufferObject *self, PyObject *args)
     }
 }
 
+static PyObject *
+Buffer_push_zeros(BufferObject *self, PyObject *args)
+{
+    Py_ssize_t len;
+    if (!PyArg_ParseTuple(args, "n", &len))
+        return NULL;
+
+    if (len < 0) {
+        PyErr_SetString(BufferWriteError, "Write out of bounds");
+        return NULL;
+    }
+    CHECK_WRITE_BOUNDS(self, len)
+
+    memset(self->pos, 0, len);
+    self->pos += len;
+    Py_RETURN_NONE;
+}
+
 static PyObject *
 Buffer_seek(BufferObject *self, PyObject *args)
 {
@@ -338,6 +356,7 @@ static PyMethodDef Buffer_methods[] = {
     {"push_uint32", (PyCFunction)Buffer_push_uint32, METH_VARARGS, "Push a 32-bit unsigned integer."},
     {"push_uint64", (PyCFunction)Buffer_push_uint64, METH_VARARGS, "Push a 64-bit unsigned integer."},
     {"push_uint_var", (PyCFunction)Buffer_push_uint_var, METH_VARARGS, "Push a QUIC variable-length unsigned integer."},
+    {"push_zeros", (PyCFunction)Buffer_push_zeros, METH_VARARGS, "Push zero bytes."},
     {"seek", (PyCFunction)Buffer_seek, METH_VARARGS, ""},
     {"tell", (PyCFunction)Buffer_tell, METH_VARARGS, ""},
     {NULL}
@@ -25,3 +25,4 @@ class Buffer:
     def push_uint32(self, v: int) -> None: ...
     def push_uint64(self, v: int) -> None: ...
     def push_uint_var(self, value: int) -> None: ...
+    def push_zeros(self, length: int) -> None: ...
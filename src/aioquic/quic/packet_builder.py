@@ -1,20 +1,19 @@
-from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from ..buffer import Buffer, size_uint_var
+from ..buffer import Buffer, encode_uint_var
 from ..tls import Epoch
 from .crypto import CryptoPair
 from .logger import QuicLoggerTrace
 from .packet import (
     NON_ACK_ELICITING_FRAME_TYPES,
     NON_IN_FLIGHT_FRAME_TYPES,
+    PACKET_LONG_HEADER,
     PACKET_NUMBER_MAX_SIZE,
     PACKET_TYPE_HANDSHAKE,
     PACKET_TYPE_INITIAL,
     PACKET_TYPE_MASK,
     QuicFrameType,
-    is_long_header,
 )
 
 PACKET_MAX_SIZE = 1280
@@ -31,21 +30,69 @@ class QuicDeliveryState(Enum):
     EXPIRED = 2
 
 
-@dataclass
 class QuicSentPacket:
-    epoch: Epoch
-    in_flight: bool
-    is_ack_eliciting: bool
-    is_crypto_packet: bool
-    packet_number: int
-    packet_type: int
-    sent_time: Optional[float] = None
-    sent_bytes: int = 0
-
-    delivery_handlers: List[Tuple[QuicDeliveryHandler, Any]] = field(
-        default_factory=list
+    """
+    A packet which was sent and is awaiting acknowledgement.
+
+    This is a slotted class rather than a dataclass to avoid a `__dict__`
+    for each of the potentially many packets in flight.
+    """
+
+    __slots__ = (
+        "epoch",
+        "in_flight",
+        "is_ack_eliciting",
+        "is_crypto_packet",
+        "packet_number",
+        "packet_type",
+        "sent_time",
+        "sent_bytes",
+        "delivery_handlers",
+        "quic_logger_frames",
     )
-    quic_logger_frames: List[Dict] = field(default_factory=list)
+
+    def __init__(
+        self,
+        epoch: Epoch,
+        in_flight: bool,
+        is_ack_eliciting: bool,
+        is_crypto_packet: bool,
+        packet_number: int,
+        packet_type: int,
+        sent_time: Optional[float] = None,
+        sent_bytes: int = 0,
+        delivery_handlers: Optional[List[Tuple[QuicDeliveryHandler, Any]]] = None,
+        quic_logger_frames: Optional[List[Dict]] = None,
+    ) -> None:
+        self.epoch = epoch
+        self.in_flight = in_flight
+        self.is_ack_eliciting = is_ack_eliciting
+        self.is_crypto_packet = is_crypto_packet
+        self.packet_number = packet_number
+        self.packet_type = packet_type
+        self.sent_time = sent_time
+        self.sent_bytes = sent_bytes
+        self.delivery_handlers: List[Tuple[QuicDeliveryHandler, Any]] = (
+            [] if delivery_handlers is None else delivery_handlers
+        )
+        self.quic_logger_frames: List[Dict] = (
+            [] if quic_logger_frames is None else quic_logger_frames
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, QuicSentPacket):
+            return NotImplemented
+
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        return "QuicSentPacket({})".format(
+            ", ".join(
+                "{}={!r}".format(name, getattr(self, name)) for name in self.__slots__
+            )
+        )
 
 
 class QuicPacketBuilderStop(Exception):
@@ -81,6 +128,16 @@ class QuicPacketBuilder:
         self._spin_bit = spin_bit
         self._version = version
 
+        # length-prefixed fields of the long header
+        self._long_header_cids = (
+            bytes([len(peer_cid)]) + peer_cid + bytes([len(host_cid)]) + host_cid
+        )
+        self._long_header_token = encode_uint_var(len(peer_token)) + peer_token
+
+        # header sizes, excluding the token of INITIAL packets
+        self._long_header_size = 11 + len(peer_cid) + len(host_cid)
+        self._short_header_size = 3 + len(peer_cid)
+
         # assembled datagrams and packets
         self._datagrams: List[bytes] = []
         self._datagram_flight_bytes = 0
@@ -90,6 +147,7 @@ class QuicPacketBuilder:
         self._total_bytes = 0
 
         # current packet
+        self._aead_tag_size = 0
         self._header_size = 0
         self._packet: Optional[QuicSentPacket] = None
         self._packet_crypto: Optional[CryptoPair] = None
@@ -124,11 +182,7 @@ class QuicPacketBuilder:
         Returns the remaining number of bytes which can be used in
         the current packet.
         """
-        return (
-            self._buffer_capacity
-            - self._buffer.tell()
-            - self._packet_crypto.aead_tag_size
-        )
+        return self._buffer_capacity - self._buffer.tell() - self._aead_tag_size
 
     @property
     def remaining_flight_space(self) -> int:
@@ -136,11 +190,7 @@ class QuicPacketBuilder:
         Returns the remaining number of bytes which can be used in
         the current packet.
         """
-        return (
-            self._flight_capacity
-            - self._buffer.tell()
-            - self._packet_crypto.aead_tag_size
-        )
+        return self._flight_capacity - self._buffer.tell() - self._aead_tag_size
 
     def flush(self) -> Tuple[List[bytes], List[QuicSentPacket]]:
         """
@@ -161,26 +211,27 @@ class QuicPacketBuilder:
         frame_type: int,
         capacity: int = 1,
         handler: Optional[QuicDeliveryHandler] = None,
-        handler_args: Sequence[Any] = [],
+        handler_args: Sequence[Any] = (),
     ) -> Buffer:
         """
         Starts a new frame.
         """
+        in_flight = frame_type not in NON_IN_FLIGHT_FRAME_TYPES
         if self.remaining_buffer_space < capacity or (
-            frame_type not in NON_IN_FLIGHT_FRAME_TYPES
-            and self.remaining_flight_space < capacity
+            in_flight and self.remaining_flight_space < capacity
         ):
             raise QuicPacketBuilderStop
 
+        packet = self._packet
         self._buffer.push_uint_var(frame_type)
         if frame_type not in NON_ACK_ELICITING_FRAME_TYPES:
-            self._packet.is_ack_eliciting = True
-        if frame_type not in NON_IN_FLIGHT_FRAME_TYPES:
-            self._packet.in_flight = True
+            packet.is_ack_eliciting = True
+        if in_flight:
+            packet.in_flight = True
         if frame_type == QuicFrameType.CRYPTO:
-            self._packet.is_crypto_packet = True
+            packet.is_crypto_packet = True
         if handler is not None:
-            self._packet.delivery_handlers.append((handler, handler_args))
+            packet.delivery_handlers.append((handler, handler_args))
         return self._buffer
 
     def start_packet(self, packet_type: int, crypto: CryptoPair) -> None:
@@ -216,14 +267,13 @@ class QuicPacketBuilder:
             self._datagram_init = False
 
         # calculate header size
-        packet_long_header = is_long_header(packet_type)
+        packet_long_header = (packet_type & PACKET_LONG_HEADER) != 0
         if packet_long_header:
-            header_size = 11 + len(self._peer_cid) + len(self._host_cid)
+            header_size = self._long_header_size
             if (packet_type & PACKET_TYPE_MASK) == PACKET_TYPE_INITIAL:
-                token_length = len(self._peer_token)
-                header_size += size_uint_var(token_length) + token_length
+                header_size += len(self._long_header_token)
         else:
-            header_size = 3 + len(self._peer_cid)
+            header_size = self._short_header_size
 
         # check we have enough space
         if packet_start + header_size >= self._buffer_capacity:
@@ -246,6 +296,7 @@ class QuicPacketBuilder:
             packet_number=self._packet_number,
             packet_type=packet_type,
         )
+        self._aead_tag_size = crypto.aead_tag_size
         self._packet_crypto = crypto
         self._packet_long_header = packet_long_header
         self._packet_start = packet_start
@@ -281,7 +332,7 @@ class QuicPacketBuilder:
 
             # write padding
             if padding_size > 0:
-                buf.push_bytes(bytes(padding_size))
+                buf.push_zeros(padding_size)
                 packet_size += padding_size
                 self._packet.in_flight = True
 
@@ -297,21 +348,19 @@ class QuicPacketBuilder:
                     packet_size
                     - self._header_size
                     + PACKET_NUMBER_SEND_SIZE
-                    + self._packet_crypto.aead_tag_size
+                    + self._aead_tag_size
                 )
 
                 buf.seek(self._packet_start)
                 buf.push_uint8(self._packet_type | (PACKET_NUMBER_SEND_SIZE - 1))
                 buf.push_uint32(self._version)
-                buf.push_uint8(len(self._peer_cid))
-                buf.push_bytes(self._peer_cid)
-                buf.push_uint8(len(self._host_cid))
-                buf.push_bytes(self._host_cid)
+                buf.push_bytes(self._long_header_cids)
                 if (self._packet_type & PACKET_TYPE_MASK) == PACKET_TYPE_INITIAL:
-                    buf.push_uint_var(len(self._peer_token))
-                    buf.push_bytes(self._peer_token)
-                buf.push_uint16(length | 0x4000)
-                buf.push_uint16(self._packet_number & 0xFFFF)
+                    buf.push_bytes(self._long_header_token)
+                # length and packet number, both sent as 2-byte fields
+                buf.push_uint32(
+                    (length | 0x4000) << 16 | (self._packet_number & 0xFFFF)
+                )
             else:
                 buf.seek(self._packet_start)
                 buf.push_uint8(
@@ -1,10 +1,19 @@
+from bisect import bisect_left, bisect_right
 from collections.abc import Sequence
 from typing import Any, Iterable, List, Optional
 
 
 class RangeSet(Sequence):
+    """
+    A sorted set of non-overlapping, non-adjacent ranges.
+
+    The ranges are stored as a flat list of boundaries ``[start0, stop0,
+    start1, stop1, ...]`` so that lookups can use binary search. An even
+    index into the boundaries is a start, an odd index is a stop.
+    """
+
     def __init__(self, ranges: Iterable[range] = []):
-        self.__ranges: List[range] = []
+        self.__bounds: List[int] = []
         for r in ranges:
             assert r.step == 1
             self.add(r.start, r.stop)
@@ -14,85 +23,89 @@ class RangeSet(Sequence):
             stop = start + 1
         assert stop > start
 
-        for i, r in enumerate(self.__ranges):
-            # the added range is entirely before current item, insert here
-            if stop < r.start:
-                self.__ranges.insert(i, range(start, stop))
-                return
-
-            # the added range is entirely after current item, keep looking
-            if start > r.stop:
-                continue
-
-            # the added range touches the current item, merge it
-            start = min(start, r.start)
-            stop = max(stop, r.stop)
-            while i < len(self.__ranges) - 1 and self.__ranges[i + 1].start <= stop:
-                stop = max(self.__ranges[i + 1].stop, stop)
-                self.__ranges.pop(i + 1)
-            self.__ranges[i] = range(start, stop)
+        bounds = self.__bounds
+
+        # fast path: the added range is entirely after all existing items
+        if not bounds or start > bounds[-1]:
+            bounds.append(start)
+            bounds.append(stop)
             return
 
-        # the added range is entirely after all existing items, append it
-        self.__ranges.append(range(start, stop))
+        # find the boundaries covered by the added range
+        i = bisect_left(bounds, start)
+        j = bisect_right(bounds, stop)
+
+        # the added range starts inside or touches an item, extend it
+        if i % 2:
+            i -= 1
+            start = bounds[i]
+
+        # the added range stops inside or touches an item, extend it
+        if j % 2:
+            stop = bounds[j]
+            j += 1
+
+        bounds[i:j] = [start, stop]
 
     def bounds(self) -> range:
-        return range(self.__ranges[0].start, self.__ranges[-1].stop)
+        return range(self.__bounds[0], self.__bounds[-1])
 
     def shift(self) -> range:
-        return self.__ranges.pop(0)
+        bounds = self.__bounds
+        r = range(bounds[0], bounds[1])
+        del bounds[:2]
+        return r
 
     def subtract(self, start: int, stop: int) -> None:
         assert stop > start
 
-        i = 0
-        while i < len(self.__ranges):
-            r = self.__ranges[i]
-
-            # the removed range is entirely before current item, stop here
-            if stop <= r.start:
-                return
-
-            # the removed range is entirely after current item, keep looking
-            if start >= r.stop:
-                i += 1
-                continue
-
-            # the removed range completely covers the current item, remove it
-            if start <= r.start and stop >= r.stop:
-                self.__ranges.pop(i)
-                continue
-
-            # the removed range touches the current item
-            if start > r.start:
-                self.__ranges[i] = range(r.start, start)
-                if stop < r.stop:
-                    self.__ranges.insert(i + 1, range(stop, r.stop))
-            else:
-                self.__ranges[i] = range(stop, r.stop)
+        bounds = self.__bounds
+        i = bisect_left(bounds, start)
+        j = bisect_right(bounds, stop)
+        if i == j and not i % 2:
+            # the removed range falls between items
+            return
 
-            i += 1
+        # trim the items which straddle the edges of the removed range
+        new_bounds: List[int] = []
+        if i % 2:
+            new_bounds.append(start)
+        if j % 2:
+            new_bounds.append(stop)
+        bounds[i:j] = new_bounds
 
     def __bool__(self) -> bool:
         raise NotImplementedError
 
     def __contains__(self, val: Any) -> bool:
-        for r in self.__ranges:
-            if val in r:
-                return True
-        return False
+        return bisect_right(self.__bounds, val) % 2 == 1
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, RangeSet):
             return NotImplemented
 
-        return self.__ranges == other.__ranges
-
-    def __getitem__(self, key: Any) -> range:
-        return self.__ranges[key]
+        return self.__bounds == other.__bounds
+
+    def __getitem__(self, key: Any) -> Any:
+        bounds = self.__bounds
+        try:
+            # fast path: non-negative index
+            if key >= 0:
+                return range(bounds[2 * key], bounds[2 * key + 1])
+        except TypeError:
+            if not isinstance(key, slice):
+                raise
+            return [
+                range(start, stop) for start, stop in zip(bounds[::2], bounds[1::2])
+            ][key]
+
+        key += len(bounds) // 2
+        if key < 0:
+            raise IndexError("RangeSet index out of range")
+        return range(bounds[2 * key], bounds[2 * key + 1])
 
     def __len__(self) -> int:
-        return len(self.__ranges)
+        return len(self.__bounds) // 2
 
     def __repr__(self) -> str:
-        return "RangeSet({})".format(repr(self.__ranges))
+        return "RangeSet({})".format(repr(list(self)))
@@ -56,15 +56,17 @@ class QuicStream:
         """
         Add a frame of received data.
         """
+        recv_buffer = self._recv_buffer
+        final_size = self._recv_final_size
         pos = frame.offset - self._recv_buffer_start
         count = len(frame.data)
         frame_end = frame.offset + count
 
         # we should receive no more data beyond FIN!
-        if self._recv_final_size is not None:
-            if frame_end > self._recv_final_size:
+        if final_size is not None:
+            if frame_end > final_size:
                 raise FinalSizeError("Data received beyond final size")
-            elif frame.fin and frame_end != self._recv_final_size:
+            elif frame.fin and frame_end != final_size:
                 raise FinalSizeError("Cannot change final size")
         if frame.fin:
             self._recv_final_size = frame_end
@@ -72,7 +74,7 @@ class QuicStream:
             self._recv_highest = frame_end
 
         # fast path: new in-order chunk
-        if pos == 0 and count and not self._recv_buffer:
+        if pos == 0 and count and not recv_buffer:
             self._recv_buffer_start += count
             return events.StreamDataReceived(
                 data=frame.data, end_stream=frame.fin, stream_id=self.__stream_id
@@ -90,10 +92,10 @@ class QuicStream:
             self._recv_ranges.add(frame.offset, frame_end)
 
         # add new data
-        gap = pos - len(self._recv_buffer)
+        gap = pos - len(recv_buffer)
         if gap > 0:
-            self._recv_buffer += bytearray(gap)
-        self._recv_buffer[pos : pos + count] = frame.data
+            recv_buffer.extend(bytes(gap))
+        recv_buffer[pos : pos + count] = frame.data
 
         # return data from the front of the buffer
         data = self._pull_data()
@@ -116,10 +118,11 @@ class QuicStream:
         if not has_data_to_read:
             return b""
 
+        recv_buffer = self._recv_buffer
         r = self._recv_ranges.shift()
         pos = r.stop - r.start
-        data = bytes(self._recv_buffer[:pos])
-        del self._recv_buffer[:pos]
+        data = bytes(recv_buffer[:pos])
+        del recv_buffer[:pos]
         self._recv_buffer_start = r.stop
         return data
 
@@ -212,12 +215,16 @@ class QuicStream:
         if delivery == QuicDeliveryState.ACKED:
             if stop > start:
                 self._send_acked.add(start, stop)
-                first_range = self._send_acked[0]
-                if first_range.start == self._send_buffer_start:
-                    size = first_range.stop - first_range.start
-                    self._send_acked.shift()
-                    self._send_buffer_start += size
-                    del self._send_buffer[:size]
+
+                # only data acknowledged at the start of the buffer can be
+                # released, anything else waits for the gap to be filled
+                if start <= self._send_buffer_start:
+                    first_range = self._send_acked[0]
+                    if first_range.start == self._send_buffer_start:
+                        size = first_range.stop - first_range.start
+                        self._send_acked.shift()
+                        self._send_buffer_start += size
+                        del self._send_buffer[:size]
         else:
             if stop > start:
                 self._send_pending.add(start, stop)
@@ -121,6 +121,21 @@ class BufferTest(TestCase):
         self.assertEqual(buf.data, b"\x08\x07\x06\x05\x04\x03\x02\x01")
         self.assertEqual(buf.tell(), 8)
 
+    def test_push_zeros(self):
+        buf = Buffer(capacity=3)
+        buf.push_uint8(0x08)
+        buf.push_zeros(2)
+        self.assertEqual(buf.data, b"\x08\x00\x00")
+        self.assertEqual(buf.tell(), 3)
+
+    def test_push_zeros_truncated(self):
+        buf = Buffer(capacity=3)
+        with self.assertRaises(BufferWriteError):
+            buf.push_zeros(4)
+        with self.assertRaises(BufferWriteError):
+            buf.push_zeros(-1)
+        self.assertEqual(buf.tell(), 0)
+
     def test_seek(self):
         buf = Buffer(data=b"01234567")
         self.assertFalse(buf.eof())
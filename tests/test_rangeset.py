@@ -219,6 +219,23 @@ class RangeSetTest(TestCase):
         self.assertFalse(r2 == r0)
         self.assertFalse(r2 == 0)
 
+    def test_getitem(self):
+        rangeset = RangeSet([range(1, 2), range(3, 4)])
+        self.assertEqual(rangeset[0], range(1, 2))
+        self.assertEqual(rangeset[1], range(3, 4))
+        self.assertEqual(rangeset[-1], range(3, 4))
+        self.assertEqual(rangeset[-2], range(1, 2))
+        with self.assertRaises(IndexError):
+            rangeset[2]
+        with self.assertRaises(IndexError):
+            rangeset[-3]
+
+    def test_getitem_slice(self):
+        rangeset = RangeSet([range(1, 2), range(3, 4), range(5, 6)])
+        self.assertEqual(rangeset[1:], [range(3, 4), range(5, 6)])
+        self.assertEqual(rangeset[:-1], [range(1, 2), range(3, 4)])
+        self.assertEqual(rangeset[::-1], [range(5, 6), range(3, 4), range(1, 2)])
+
     def test_len(self):
         rangeset = RangeSet()
         self.assertEqual(len(rangeset), 0)